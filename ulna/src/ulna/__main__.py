@@ -46,18 +46,17 @@ class App:
 
         config_path = "ulna-project.toml"
 
-        match config.load(config_path):
-            case result.Err(errors):
-                for error in errors:
-                    self.logger.error(error.render_message())
+        loaded_config = config.load(config_path)
 
-                return 1
-            case result.Ok(_config_):
-                pass  # awkward
+        if isinstance(loaded_config, result.Err):
+            for error in loaded_config.err_value:
+                self.logger.error(error.render_message())
+
+            return 1
 
         project_builder = builder.Builder(
             self.logger,
-            config=_config_,
+            config=loaded_config.ok_value,
             binary_dir=f"{venv_path}/bin",
         )
 
@@ -91,6 +90,7 @@ def build_parser() -> argparse.ArgumentParser:
 
     _ = build_subparser.add_argument(
         "--mode",
+        type=sys.intern,
         choices=BUILD_MODE_OPTIONS,
         default=BUILD_MODE_DEFAULT,
         help="optimizes for performance or for debugging",
@@ -9,8 +9,6 @@ from __future__ import annotations
 
 import contextlib
 import os
-import subprocess
-import textwrap
 import typing
 
 from . import compilers
@@ -27,6 +25,19 @@ class Builder:
     It is what builds a given project.
     """
 
+    __slots__ = (
+        "additional_flags",
+        "binary_dir",
+        "build_options",
+        "compiler_name",
+        "dependencies",
+        "included_dirs",
+        "included_shared_objects",
+        "logger",
+        "object_files",
+        "program_name",
+    )
+
     def __init__(
         self,
         logger: logger.Logger,
@@ -50,15 +61,23 @@ class Builder:
             "include_shared",
             [],
         )
+        # entries used to be pasted into a shell command, so an entry
+        # may hold several whitespace-separated arguments
+        self.object_files: typing.Final = tuple(
+            part
+            for file in self.included_shared_objects
+            for part in (file if file.endswith(".o") else file + ".o").split()
+        )
 
         self.build_options: typing.Final = config.get("build", {})
         self.compiler_name: typing.Final = self.build_options.get(
             "compiler",
             compilers.DEFAULT,
         )
-        self.additional_flags: typing.Final = self.build_options.get(
-            "additional_flags",
-            [],
+        self.additional_flags: typing.Final = tuple(
+            part
+            for flag in self.build_options.get("additional_flags", [])
+            for part in flag.split()
         )
 
     def build(self, *, mode: datatypes.BuildMode) -> bool:
@@ -68,6 +87,8 @@ class Builder:
         Return `True` on success, `False` on failure.
         """
 
+        import subprocess  # noqa: PLC0415
+
         compiler = compilers.OPTIONS[self.compiler_name]
 
         command = compiler.generate_command(
@@ -75,27 +96,33 @@ class Builder:
             self.program_name,
             mode=mode,
             binary_dir=self.binary_dir,
-            dependencies=self.included_shared_objects,
+            object_files=self.object_files,
             additional_flags=self.additional_flags,
         )
 
-        self.logger.info(command)
+        self.logger.info_lazy(lambda: " ".join(command))
 
         completed_process = subprocess.run(
-            command.split(),
+            command,
             capture_output=True,
             check=False,
         )
 
         if completed_process.returncode != 0:
             self.logger.error(f"{self.program_name} failed to build")
-            self.logger.error(
-                # e.g. gcc: <gcc error message>
-                textwrap.indent(
-                    completed_process.stderr.decode(),
-                    f"{self.compiler_name}: ",
+
+            prefix = f"{self.compiler_name}: "
+            stderr = completed_process.stderr.decode().rstrip("\n")
+
+            if stderr:
+                # like `textwrap.indent`, blank lines are left untouched
+                self.logger.error(
+                    # e.g. gcc: <gcc error message>
+                    "\n".join(
+                        prefix + line if line.strip() else line
+                        for line in stderr.splitlines()
+                    )
                 )
-            )
 
             self.delete_binary()
 
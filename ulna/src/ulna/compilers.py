@@ -8,27 +8,41 @@ import typing
 
 from . import datatypes
 
+_GCC_BASE_FLAGS = ("-Wall", "-Wextra")
+
+_GCC_BUILD_MODE_FLAGS: dict[datatypes.BuildMode, tuple[str, ...]] = {
+    "development": (
+        *_GCC_BASE_FLAGS,
+        "-O0",
+        "-g2",
+        "-Wpedantic",
+        "-Werror",
+        "-fsanitize=undefined,address",
+    ),
+    "release": (
+        *_GCC_BASE_FLAGS,
+        "-O2",
+        "-march=native",
+        "-mtune=native",
+    ),
+}
+
 
 class GCC(datatypes.Compiler):
     """
     The GCC compiler.
     """
 
+    __slots__ = ()
+
     name = "gcc"
-    _base_flags: typing.Final = " -Wall -Wextra "
 
     @typing.override
-    def get_build_mode_flags(self, mode: datatypes.BuildMode) -> str:
-        match mode:
-            case "development":
-                return self._base_flags + (
-                    " -O0 -g2 -Wpedantic -Werror "
-                    " -fsanitize=undefined,address "
-                )
-            case "release":
-                return (
-                    self._base_flags + " -O2 -march=native -mtune=native "
-                )
+    def get_build_mode_flags(
+        self,
+        mode: datatypes.BuildMode,
+    ) -> tuple[str, ...]:
+        return _GCC_BUILD_MODE_FLAGS[mode]
 
     @typing.override
     def get_source_kind_arguments(
@@ -36,12 +50,12 @@ class GCC(datatypes.Compiler):
         kind: datatypes.SourceKind,
         source_name: str,
         binary_dir: str,
-    ) -> str:
+    ) -> list[str]:
         match kind:
             case "library":
-                return f" -c -o {source_name}.o "
+                return ["-c", "-o", f"{source_name}.o"]
             case "program":
-                return f" -o {binary_dir}/{source_name} "
+                return ["-o", f"{binary_dir}/{source_name}"]
 
 
 OPTIONS: dict[datatypes.CompilerName, datatypes.Compiler] = {
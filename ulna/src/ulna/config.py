@@ -6,10 +6,11 @@ file.
 from __future__ import annotations
 
 import dataclasses
+import functools
+import os
 import typing
 
 import result
-import tomllib
 
 from . import datatypes
 from . import predicates
@@ -20,7 +21,7 @@ from . import validator
 # TODO: make it nicer
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class ConfigFileNotFoundError(datatypes.AbstractError):
     """
     Error when the configuration file does not exist.
@@ -33,7 +34,7 @@ class ConfigFileNotFoundError(datatypes.AbstractError):
         return f"file {self.path!r} could not be found"
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class ConfigFilePermissionError(datatypes.AbstractError):
     """
     Error when the configuration file does not have read
@@ -47,7 +48,7 @@ class ConfigFilePermissionError(datatypes.AbstractError):
         return f"file {self.path!r} cannot be read (missing permissions)"
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class MalformedTOMLError(datatypes.AbstractError):
     """
     Error when the configuration file's TOML is malformed.
@@ -68,46 +69,55 @@ type LoadError = (
 )
 
 
-PROGRAM_SECTION_VALIDATOR = (
-    validator.Builder("program")
-    .add_field("name", predicates.is_project_identifier)
-    .add_field("description", predicates.is_string, optional=True)
-    .build(for_type=scheme.ProgramSectionScheme)
-)
+@functools.cache
+def get_config_validator() -> validator.Validator[scheme.ConfigurationScheme]:
+    """
+    Return the validator of the configuration file.
+
+    It is built on first use only, so runs that never load the
+    configuration do not pay for it.
+    """
 
-DEPENDENCIES_SECTION_VALIDATOR = (
-    validator.Builder("dependencies")
-    .add_field(
-        "include_dirs",
-        predicates.is_list_of_strings,
-        optional=True,
+    program_section_validator = (
+        validator.Builder("program")
+        .add_field("name", predicates.is_project_identifier)
+        .add_field("description", predicates.is_string, optional=True)
+        .build(for_type=scheme.ProgramSectionScheme)
     )
-    .add_field(
-        "include_shared",
-        predicates.is_list_of_strings,
-        optional=True,
+
+    dependencies_section_validator = (
+        validator.Builder("dependencies")
+        .add_field(
+            "include_dirs",
+            predicates.is_list_of_strings,
+            optional=True,
+        )
+        .add_field(
+            "include_shared",
+            predicates.is_list_of_strings,
+            optional=True,
+        )
+        .build(for_type=scheme.DependenciesSectionScheme)
     )
-    .build(for_type=scheme.DependenciesSectionScheme)
-)
 
-BUILD_SECTION_VALIDATOR = (
-    validator.Builder("build")
-    .add_field("compiler", predicates.is_compiler_name, optional=True)
-    .add_field(
-        "additional_flags",
-        predicates.is_list_of_strings,
-        optional=True,
+    build_section_validator = (
+        validator.Builder("build")
+        .add_field("compiler", predicates.is_compiler_name, optional=True)
+        .add_field(
+            "additional_flags",
+            predicates.is_list_of_strings,
+            optional=True,
+        )
+        .build(for_type=scheme.BuildSectionScheme)
     )
-    .build(for_type=scheme.BuildSectionScheme)
-)
 
-CONFIG_VALIDATOR = (
-    validator.Builder()
-    .add_section(PROGRAM_SECTION_VALIDATOR)
-    .add_section(DEPENDENCIES_SECTION_VALIDATOR, optional=True)
-    .add_section(BUILD_SECTION_VALIDATOR, optional=True)
-    .build(for_type=scheme.ConfigurationScheme)
-)
+    return (
+        validator.Builder()
+        .add_section(program_section_validator)
+        .add_section(dependencies_section_validator, optional=True)
+        .add_section(build_section_validator, optional=True)
+        .build(for_type=scheme.ConfigurationScheme)
+    )
 
 
 def load(
@@ -116,23 +126,60 @@ def load(
     """
     Read, load and validate the configuration file at the given
     `path`.
+
+    A successful outcome is cached as long as the file is left
+    untouched, so loading the same configuration again is free.
+    The returned configuration is shared between these calls and
+    must not be mutated.
     """
 
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return result.Err(frozenset({ConfigFileNotFoundError(path)}))
+
+    loaded = _load_cached(
+        path,
+        os.path.abspath(path),
+        stat.st_dev,
+        stat.st_ino,
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+
+    # failures are not kept, as fixing them does not necessarily
+    # change the modification time (e.g. `chmod`)
+    if isinstance(loaded, result.Err):
+        _load_cached.cache_clear()
+
+    return loaded
+
+
+# the file's identity and state are only there to key the cache, so
+# that another file or a modified one is never served a stale outcome
+@functools.lru_cache(maxsize=8)
+def _load_cached(
+    path: str,
+    absolute_path: str,
+    _device: int,
+    _inode: int,
+    _mtime_ns: int,
+    _size: int,
+) -> result.Result[scheme.ConfigurationScheme, frozenset[LoadError]]:
+    import tomllib  # noqa: PLC0415
+
     try:
         # we are using the context manager afterwards
-        file = open(path, encoding="utf-8")  # noqa: SIM115
+        file = open(absolute_path, "rb")  # noqa: SIM115
     except OSError:
         return result.Err(frozenset({ConfigFileNotFoundError(path)}))
 
     try:
         with file:
-            raw_contents = file.read()
+            config = tomllib.load(file)
     except PermissionError:
         return result.Err(frozenset({ConfigFilePermissionError(path)}))
-
-    try:
-        config = tomllib.loads(raw_contents)
     except tomllib.TOMLDecodeError:
         return result.Err(frozenset({MalformedTOMLError(path)}))
 
-    return CONFIG_VALIDATOR.validate(config).map_err(frozenset)
+    return get_config_validator().validate(config).map_err(frozenset)
@@ -5,15 +5,19 @@ Shared datatypes used across ulna.
 from __future__ import annotations
 
 import abc
-import dataclasses
 import typing
 
+if typing.TYPE_CHECKING:
+    import collections.abc
+
 
 class AbstractError(abc.ABC):
     """
     Represents an error that can be rendered into a message.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def render_message(self) -> str:
         """
@@ -26,12 +30,14 @@ class Compiler(abc.ABC):
     Represents a C compiler (e.g. GCC).
     """
 
+    __slots__ = ()
+
     name: typing.ClassVar[str]
 
     @abc.abstractmethod
-    def get_build_mode_flags(self, mode: BuildMode) -> str:
+    def get_build_mode_flags(self, mode: BuildMode) -> tuple[str, ...]:
         """
-        Return a string of the flags for the given build `mode`.
+        Return a tuple of the flags for the given build `mode`.
         """
 
     @abc.abstractmethod
@@ -40,9 +46,9 @@ class Compiler(abc.ABC):
         kind: SourceKind,
         source_name: str,
         binary_dir: str,
-    ) -> str:
+    ) -> list[str]:
         """
-        Return a string of the flags given a `source_name` and
+        Return a list of the flags given a `source_name` and
         its `kind`.
         """
 
@@ -53,57 +59,37 @@ class Compiler(abc.ABC):
         *,
         mode: BuildMode,
         binary_dir: str,
-        dependencies: list[str] | None = None,
-        additional_flags: list[str] | None = None,
-    ) -> str:
+        object_files: collections.abc.Sequence[str] = (),
+        additional_flags: collections.abc.Sequence[str] = (),
+    ) -> list[str]:
         """
-        Generate a shell command to build `source_name` using the compiler.
+        Generate the command line to build `source_name` using the
+        compiler, as a list of arguments.
+
+        `object_files` are expected to already have their `.o`
+        extension.
         """
 
-        if dependencies is None:
-            dependencies = []
-
-        if additional_flags is None:
-            additional_flags = []
-
-        template = (
-            "{name} {task} {source_name}.c {object_files} "
-            "{build_mode_flags} {additional_flags}"
-        )
-
-        task = self.get_source_kind_arguments(
-            kind,
-            source_name,
-            binary_dir,
-        )
-        object_files = " ".join(
-            file if file.endswith(".o") else file + ".o"
-            for file in dependencies
-        )
-        build_mode_flags = self.get_build_mode_flags(mode)
-        _additional_flags_ = " ".join(additional_flags)
-
-        return template.format(
-            name=self.name,
-            task=task,
-            source_name=source_name,
-            object_files=object_files,
-            build_mode_flags=build_mode_flags,
-            additional_flags=_additional_flags_,
-        )
-
-
-@dataclasses.dataclass(slots=True, frozen=True)
-class Predicate[T]:
+        return [
+            self.name,
+            *self.get_source_kind_arguments(kind, source_name, binary_dir),
+            f"{source_name}.c",
+            *object_files,
+            *self.get_build_mode_flags(mode),
+            *additional_flags,
+        ]
+
+
+class Predicate[T](typing.Protocol):
     """
     Function that checks if a value is of type `T`.
+
+    It carries the `name` of that type, used in error messages.
     """
 
     name: str
-    function: typing.Callable[[typing.Any], typing.TypeGuard[T]]
 
-    def __call__(self, value: typing.Any, /) -> typing.TypeGuard[T]:  # noqa: D102
-        return self.function(value)
+    def __call__(self, value: typing.Any, /) -> typing.TypeGuard[T]: ...  # noqa: D102
 
 
 class UlnaNamespace(typing.Protocol):
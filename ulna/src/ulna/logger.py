@@ -7,17 +7,36 @@ from __future__ import annotations
 import sys
 import typing
 
-import anstrip
-
 if typing.TYPE_CHECKING:
     import _typeshed
 
 
+def _is_tty(stream: typing.Any) -> bool:
+    isatty = getattr(stream, "isatty", None)
+
+    return isatty is not None and bool(isatty())
+
+
 class Logger:
     """
     Logger of ulna.
     """
 
+    __slots__ = ("err", "err_is_tty", "out", "out_is_tty", "verbose")
+
+    _PREFIXES: typing.ClassVar[dict[str, str]] = {
+        "error": "\x1b[1;31mError:\x1b[22;39m\t",
+        "warning": "\x1b[1;33mWarning:\x1b[22;39m\t",
+        "info": "\x1b[1;34mInfo:\x1b[22;39m\t",
+        "hint": "\x1b[1;35mHint:\x1b[22;39m\t",
+    }
+    _PLAIN_PREFIXES: typing.ClassVar[dict[str, str]] = {
+        "error": "Error:\t",
+        "warning": "Warning:\t",
+        "info": "Info:\t",
+        "hint": "Hint:\t",
+    }
+
     def __init__(
         self,
         *,
@@ -29,32 +48,51 @@ class Logger:
         self.err: typing.Any = sys.stderr if err is None else err
         self.verbose = verbose
 
-    @staticmethod
-    def _make_line(
+        self.out_is_tty: typing.Final = _is_tty(self.out)
+        self.err_is_tty: typing.Final = _is_tty(self.err)
+
+    @classmethod
+    def _write(
+        cls,
         label: str,
-        color: typing.Literal[1, 3, 4, 5],
-        line: str,
-    ) -> str:
-        return f"\x1b[1;3{color}m{label.title()}:\x1b[22;39m\t{line}"
+        message: str,
+        *,
+        file: typing.Any,
+        is_tty: bool,
+    ) -> None:
+        if is_tty:
+            prefix = cls._PREFIXES[label]
+        else:
+            import anstrip  # noqa: PLC0415
+
+            prefix = cls._PLAIN_PREFIXES[label]
+            message = anstrip.strip(message)
+
+        lines = message.splitlines()
+
+        if not lines:
+            return
+
+        file.write(prefix + ("\n" + prefix).join(lines) + "\n")
 
     def error(self, message: str) -> None:
         """
         Log an error.
         """
 
-        for line in message.splitlines():
-            anstrip.print(self._make_line("error", 1, line), file=self.err)
+        self._write("error", message, file=self.err, is_tty=self.err_is_tty)
 
     def warn(self, message: str) -> None:
         """
         Log a warning.
         """
 
-        for line in message.splitlines():
-            anstrip.print(
-                self._make_line("warning", 3, line),
-                file=self.err,
-            )
+        self._write(
+            "warning",
+            message,
+            file=self.err,
+            is_tty=self.err_is_tty,
+        )
 
     def info(self, message: str) -> None:
         """
@@ -64,13 +102,22 @@ class Logger:
         if not self.verbose:
             return
 
-        for line in message.splitlines():
-            anstrip.print(self._make_line("info", 4, line), file=self.out)
+        self._write("info", message, file=self.out, is_tty=self.out_is_tty)
+
+    def info_lazy(self, make_message: typing.Callable[[], str]) -> None:
+        """
+        Log some information, only building the message with
+        `make_message` if it is going to be shown.
+        """
+
+        if not self.verbose:
+            return
+
+        self.info(make_message())
 
     def hint(self, message: str) -> None:
         """
         Log a hint.
         """
 
-        for line in message.splitlines():
-            anstrip.print(self._make_line("hint", 5, line), file=self.out)
+        self._write("hint", message, file=self.out, is_tty=self.out_is_tty)
@@ -1,9 +1,13 @@
 """
 Various simple predicates used in validators.
+
+Types are compared exactly rather than with `isinstance`: values come
+from TOML, which never produces instances of subclasses.
 """
 
 from __future__ import annotations
 
+import re
 import typing
 
 from . import datatypes
@@ -16,10 +20,21 @@ def make_predicate[T](
     datatypes.Predicate[T],
 ]:
     """
-    Decorator to make a `Predicate` object.
+    Decorator to make a `Predicate` out of a function.
+
+    The function is returned as is, with `name` attached to it, so
+    calling the predicate does not go through a wrapper.
     """
 
-    return lambda function: datatypes.Predicate(name, function)
+    def decorator(
+        function: typing.Callable[[typing.Any], typing.TypeGuard[T]],
+    ) -> datatypes.Predicate[T]:
+        predicate = typing.cast("datatypes.Predicate[T]", function)
+        predicate.name = name
+
+        return predicate
+
+    return decorator
 
 
 @make_predicate("string")
@@ -28,23 +43,7 @@ def is_string(value: typing.Any) -> typing.TypeGuard[str]:
     Determine whether `value` is a string.
     """
 
-    return isinstance(value, str)
-
-
-def _is_list_of[ItemT](
-    value: typing.Any,
-    *,
-    item_type: type[ItemT],
-) -> typing.TypeGuard[list[ItemT]]:
-    """
-    Determine whether `value` is a list containing items of type
-    `item_type`.
-    """
-
-    return isinstance(value, list) and all(
-        isinstance(item, item_type)
-        for item in typing.cast("list[typing.Any]", value)
-    )
+    return type(value) is str
 
 
 @make_predicate("list of strings")
@@ -55,7 +54,9 @@ def is_list_of_strings(
     Determine whether `value` is a list of strings.
     """
 
-    return _is_list_of(value, item_type=str)
+    return type(value) is list and set(
+        map(type, typing.cast("list[typing.Any]", value))
+    ) <= {str}
 
 
 def is_any_dict(
@@ -66,11 +67,10 @@ def is_any_dict(
     key and value types.
     """
 
-    return isinstance(value, dict)
+    return type(value) is dict
 
 
-def _is_lowercase_letter_or_underscore(particle: str) -> bool:
-    return all("a" <= char <= "z" or char == "_" for char in particle)
+_PROJECT_IDENTIFIER_PATTERN = re.compile(r"[a-z_]*")
 
 
 @make_predicate("project identifier")
@@ -79,10 +79,10 @@ def is_project_identifier(value: typing.Any) -> typing.TypeGuard[str]:
     Determine whether `value` is a project identifier.
     """
 
-    if not isinstance(value, str):
+    if type(value) is not str:
         return False
 
-    return all(_is_lowercase_letter_or_underscore(char) for char in value)
+    return _PROJECT_IDENTIFIER_PATTERN.fullmatch(value) is not None
 
 
 @make_predicate("compiler name")
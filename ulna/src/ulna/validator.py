@@ -7,7 +7,6 @@ from __future__ import annotations
 import dataclasses
 import typing
 
-import option
 import result
 
 from . import datatypes
@@ -138,12 +137,34 @@ class ValidationField(typing.NamedTuple):
     optional: bool
 
 
+class _FieldCheck(typing.NamedTuple):
+    validator: datatypes.Predicate[typing.Any]
+    type_error: FieldTypeError
+    bit: int
+
+
+class _SectionCheck(typing.NamedTuple):
+    validator: Validator[typing.Any]
+    bit: int
+
+
 class Validator[T]:
     """
     Handles validation of the `T` node given a dumb value,
     usually extracted from parsing the TOML config file.
     """
 
+    __slots__ = (
+        "_fields",
+        "_for_type",
+        "_kind_error",
+        "_missing_errors",
+        "_required_mask",
+        "_sections",
+        "name",
+        "section_name",
+    )
+
     def __init__(
         self,
         *,
@@ -153,72 +174,92 @@ class Validator[T]:
         for_type: type[T],
     ) -> None:
         self.section_name: typing.Final = name
+        # name of the validated node
+        self.name: typing.Final = "config" if name is None else name
 
-        self._fields = list(fields)
-        self._sections = list(sections)
-        self._for_type = for_type
-
-    @property
-    def name(self) -> str:
-        """
-        Name of the validated node.
-        """
+        self._fields: dict[str, _FieldCheck] = {}
+        self._sections: dict[str, _SectionCheck] = {}
+        missing_errors: list[ValidationError] = []
 
-        return "config" if self.section_name is None else self.section_name
+        for field in fields:
+            bit = 0
 
-    def _get_entry_names(self) -> set[str]:
-        return {field.name for field in self._fields} | {
-            section.name for section in self._sections
-        }
+            if not field.optional:
+                bit = 1 << len(missing_errors)
+                missing_errors.append(MissingFieldError(field.name, name))
 
-    def _check_field(
-        self,
-        name: str,
-        value: typing.Any | None,
-        validator: datatypes.Predicate[typing.Any],
-        *,
-        optional: bool,
-    ) -> result.Result[option.Option[typing.Any], ValidationError]:
-        if value is None:
-            if not optional:
-                return result.Err(
-                    MissingFieldError(name, self.section_name)
-                )
-            return result.Ok(option.Nothing())
-
-        if not validator(value):
-            return result.Err(
-                FieldTypeError(
-                    name,
-                    self.section_name,
-                    validator.name,
-                )
+            self._fields[field.name] = _FieldCheck(
+                field.validator,
+                FieldTypeError(field.name, name, field.validator.name),
+                bit,
             )
 
-        return result.Ok(option.Some(value))
+        for section in sections:
+            bit = 0
 
-    @staticmethod
-    def _check_section[SectionT](
-        section: typing.Any | None,
-        validator: Validator[SectionT],
-        *,
-        optional: bool,
-    ) -> result.Result[option.Option[SectionT], list[ValidationError]]:
-        if section is None:
-            if not optional:
-                return result.Err([MissingSectionError(validator.name)])
+            if not section.optional:
+                bit = 1 << len(missing_errors)
+                missing_errors.append(MissingSectionError(section.name))
 
-            return result.Ok(option.Nothing())
+            self._sections[section.name] = _SectionCheck(
+                section.validator,
+                bit,
+            )
 
-        return validator.validate(section).map(option.Some)
+        # the n-th error is reported when the n-th bit is not seen
+        self._missing_errors = tuple(missing_errors)
+        self._required_mask = (1 << len(missing_errors)) - 1
+        self._kind_error = SectionKindError(self.name)
+        self._for_type = for_type
 
-    def _get_unrecognized_entries(
+    def _collect_errors(
         self,
-        data: dict[str, typing.Any],
-    ) -> set[str]:
-        recognized_entries = self._get_entry_names()
+        data: typing.Any,
+        errors: list[ValidationError],
+    ) -> None:
+        # sections report into the list of their parent, so the whole
+        # tree is walked without building intermediate results
+        if not predicates.is_any_dict(data):
+            errors.append(self._kind_error)
+            return
+
+        append = errors.append
+        fields = self._fields
+        sections = self._sections
+
+        # bits of the required entries that were provided
+        seen = 0
+
+        # a `None` value counts as missing
+        for key, value in data.items():
+            field = fields.get(key)
+
+            if field is not None:
+                if value is not None:
+                    seen |= field.bit
+
+                    if not field.validator(value):
+                        append(field.type_error)
+
+                continue
+
+            section = sections.get(key)
+
+            if section is not None:
+                if value is not None:
+                    seen |= section.bit
+                    section.validator._collect_errors(value, errors)  # noqa: SLF001
+
+                continue
 
-        return {key for key in data if key not in recognized_entries}
+            append(NonexistentFieldError(key, self.section_name))
+
+        missing = self._required_mask & ~seen
+
+        while missing:
+            lowest_bit = missing & -missing
+            append(self._missing_errors[lowest_bit.bit_length() - 1])
+            missing ^= lowest_bit
 
     def validate(
         self,
@@ -228,40 +269,9 @@ class Validator[T]:
         Return whether `value` is a valid `T` node.
         """
 
-        if not predicates.is_any_dict(data):
-            return result.Err([SectionKindError(self.name)])
-
         errors: list[ValidationError] = []
 
-        unrecognized_entries = self._get_unrecognized_entries(data)
-
-        for entry in unrecognized_entries:
-            errors.append(NonexistentFieldError(entry, self.section_name))  # noqa: PERF401
-
-        for field in self._fields:
-            field_value = data.get(field.name)
-
-            match self._check_field(
-                field.name,
-                field_value,
-                field.validator,
-                optional=field.optional,
-            ):
-                case result.Err(error):
-                    errors.append(error)
-                case result.Ok():
-                    pass
-
-        for section in self._sections:
-            match self._check_section(
-                data.get(section.name),
-                section.validator,
-                optional=section.optional,
-            ):
-                case result.Err(section_errors):
-                    errors.extend(section_errors)
-                case result.Ok():
-                    pass
+        self._collect_errors(data, errors)
 
         if errors:
             return result.Err(errors)
@@ -276,6 +286,8 @@ class Builder:
     Each method returns the builder so it can be chained.
     """
 
+    __slots__ = ("_fields", "_sections", "name")
+
     def __init__(self, name: str | None = None) -> None:
         self.name: typing.Final = name
         self._fields: list[ValidationField] = []